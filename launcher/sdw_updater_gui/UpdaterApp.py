@@ -163,9 +163,11 @@ class UpdaterApp(QDialog, Ui_UpdaterDialog):
         self.applyUpdatesButton.hide()
         self.cancelButton.setEnabled(False)
         self.upgrade_thread = UpgradeThread()
-        self.upgrade_thread.start()
+        # Connect signals before starting the thread, so that no early
+        # emission is dropped.
         self.upgrade_thread.upgrade_signal.connect(self.upgrade_status)
         self.upgrade_thread.progress_signal.connect(self.update_progress_bar)
+        self.upgrade_thread.start()
 
     def reboot_workstation(self):
         """
@@ -28,6 +28,9 @@ LOCK_ERROR = "Error obtaining lock on '{}'. Process may already be running."
 # Format for those logs
 LOG_FORMAT = "%(asctime)s - %(name)s:%(lineno)d(%(funcName)s) " "%(levelname)s: %(message)s"
 
+# Matches ANSI color escape sequences in command output
+ANSI_COLORS_REGEX = re.compile(r"\u001b\[.*?[@-~]")
+
 # Namespace for primary logger, additional namespaces should be defined by module user
 SD_LOGGER_PREFIX = "sd"
 
@@ -186,7 +189,7 @@ def strip_ansi_colors(str):
     """
     Strip ANSI colors from command output
     """
-    return re.sub(r"\u001b\[.*?[@-~]", "", str)
+    return ANSI_COLORS_REGEX.sub("", str)
 
 
 def is_sdapp_halted() -> bool:
@@ -63,9 +63,14 @@ def copy_config():
     Copies config.json and sd-journalist.sec to /srv/salt/sd
     """
     try:
-        subprocess.check_call(["sudo", "cp", os.path.join(SCRIPTS_PATH, "config.json"), SALT_PATH])
         subprocess.check_call(
-            ["sudo", "cp", os.path.join(SCRIPTS_PATH, "sd-journalist.sec"), SALT_PATH]
+            [
+                "sudo",
+                "cp",
+                os.path.join(SCRIPTS_PATH, "config.json"),
+                os.path.join(SCRIPTS_PATH, "sd-journalist.sec"),
+                SALT_PATH,
+            ]
         )
     except subprocess.CalledProcessError:
         raise SDWAdminException("Error copying configuration")
@@ -116,22 +121,15 @@ def perform_uninstall(keep_template_rpm=False):
         print("Reverting dom0 configuration")
         subprocess.check_call(["sudo", "qubesctl", "state.sls", "sd-clean-all"])
         subprocess.check_call([os.path.join(SCRIPTS_PATH, "scripts/clean-salt")])
-        if not keep_template_rpm:
-            print("Uninstalling Template")
-            subprocess.check_call(
-                [
-                    "sudo",
-                    "dnf",
-                    "-y",
-                    "-q",
-                    "remove",
-                    "qubes-template-securedrop-workstation-buster",
-                ]
-            )
-        print("Uninstalling dom0 config package")
-        subprocess.check_call(
-            ["sudo", "dnf", "-y", "-q", "remove", "securedrop-workstation-dom0-config"]
-        )
+        # Remove all packages in a single dnf transaction, to avoid paying
+        # for the sudo and dnf startup (metadata loading) more than once.
+        packages = ["securedrop-workstation-dom0-config"]
+        if keep_template_rpm:
+            print("Uninstalling dom0 config package")
+        else:
+            print("Uninstalling Template and dom0 config package")
+            packages.insert(0, "qubes-template-securedrop-workstation-buster")
+        subprocess.check_call(["sudo", "dnf", "-y", "-q", "remove"] + packages)
     except subprocess.CalledProcessError:
         raise SDWAdminException("Error during uninstall")
 
@@ -11,8 +11,9 @@ import tempfile
 from qubesadmin import Qubes
 
 
-TOR_V3_HOSTNAME_REGEX = r"^[a-z2-7]{56}\.onion$"
-TOR_V3_AUTH_REGEX = r"^[A-Z2-7]{52}$"
+TOR_V3_HOSTNAME_REGEX = re.compile(r"^[a-z2-7]{56}\.onion$")
+TOR_V3_AUTH_REGEX = re.compile(r"^[A-Z2-7]{52}$")
+SUBMISSION_KEY_FPR_REGEX = re.compile(r"[a-fA-F0-9]{40}")
 
 # CONFIG_FILEPATH = "/srv/salt/sd/config.json"
 CONFIG_FILEPATH = "config.json"
@@ -72,12 +73,12 @@ class SDWConfigValidator(object):
     def confirm_onion_v3_url(self):
         assert "hidserv" in self.config
         assert "hostname" in self.config["hidserv"]
-        assert re.match(TOR_V3_HOSTNAME_REGEX, self.config["hidserv"]["hostname"])
+        assert TOR_V3_HOSTNAME_REGEX.match(self.config["hidserv"]["hostname"])
 
     def confirm_onion_v3_auth(self):
         assert "hidserv" in self.config
         assert "key" in self.config["hidserv"]
-        assert re.match(TOR_V3_AUTH_REGEX, self.config["hidserv"]["key"])
+        assert TOR_V3_AUTH_REGEX.match(self.config["hidserv"]["key"])
 
     def confirm_submission_privkey_file(self):
         """
@@ -101,7 +102,8 @@ class SDWConfigValidator(object):
 
     def confirm_submission_privkey_fingerprint(self):
         assert "submission_key_fpr" in self.config
-        assert re.match("^[a-fA-F0-9]{40}$", self.config["submission_key_fpr"])
+        # Use fullmatch, since "$" would also accept a trailing newline.
+        assert SUBMISSION_KEY_FPR_REGEX.fullmatch(self.config["submission_key_fpr"])
 
     def read_config_file(self):
         with open(self.config_filepath, "r") as f:
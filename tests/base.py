@@ -176,15 +176,16 @@ remotevm = sd-log
         # Because we target an AppVM, we cannot easily use the Pyhton tempfile
         # module here without relying on a helper script. Instead, we use the
         # mktemp utility to create a test file with the OpenDocument extension.
-        tmpfile_name = self._run("mktemp -t XXXXXX.odt")
-
+        #
         # The --norun argument ensures that we do not launch any application,
         # regardless of the result of this invocation.
-        mailcap_result = self._run("run-mailcap --norun {}".format(tmpfile_name))
-
+        #
         # For simplicity, we remove the tempfile here instead of in a separate
-        # teardown method.
-        self._run("rm {}".format(tmpfile_name))
+        # teardown method. All three steps share a single qvm-run invocation,
+        # since each call incurs a full qrexec round-trip; the first line of
+        # output is the tempfile name, the second is the run-mailcap result.
+        cmd = 'f=$(mktemp -t XXXXXX.odt) && echo "$f" && run-mailcap --norun "$f"; rm -f "$f"'
+        tmpfile_name, mailcap_result = self._run(cmd).splitlines()
 
         # Ensure that the wildcard rule worked as expected.
         self.assertEqual(mailcap_result, 'logger "Mailcap is disabled." <{}'.format(tmpfile_name))
@@ -1,4 +1,3 @@
-import re
 import subprocess
 import unittest
 import tempfile
@@ -7,18 +6,13 @@ from base import SD_VM_Local_Test
 
 
 def find_fp_from_gpg_output(gpg):
-
-    lines = gpg.decode("utf-8").split("\n")
-
-    for line in lines:
-        # dom0 uses Fedora25 with gpg 1.4.22, whereas AppVMs
-        # use Debian9 with gpg 2.1.18, so we'll match fingerprint
-        # by a loose regex rather than substring match.
-        regex = "\s*(Key fingerprint = )?([A-F0-9\s]{50})$"
-        m = re.match(regex, line)
-        if m:
-            fp = m.groups()[1]
-            return fp
+    # Parse the machine-readable --with-colons output line by line, which is
+    # stable across gpg releases, rather than matching the human-readable
+    # fingerprint layout. The fingerprint is the 10th field of an "fpr"
+    # record, and the first such record belongs to the primary key.
+    for line in gpg.splitlines():
+        if line.startswith(b"fpr:"):
+            return line.split(b":")[9].decode("utf-8")
 
 
 def get_local_fp():
@@ -30,12 +24,19 @@ def get_local_fp():
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
-        results = subprocess.check_output(["gpg", "-k", "--with-fingerprint"], env=gpg_env)
+        results = subprocess.check_output(
+            ["gpg", "-k", "--with-colons", "--fingerprint"], env=gpg_env
+        )
         return find_fp_from_gpg_output(results)
 
 
 def get_remote_fp():
-    cmd = ["qvm-run", "-p", "sd-gpg", "/usr/bin/gpg --list-secret-keys --fingerprint"]
+    cmd = [
+        "qvm-run",
+        "-p",
+        "sd-gpg",
+        "/usr/bin/gpg --list-secret-keys --with-colons --fingerprint",
+    ]
 
     p = subprocess.check_output(cmd)
 